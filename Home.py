@@ -5,8 +5,8 @@
 # ---------------------------------------------------
 import streamlit as st
 import module.github as github
-import module.gpt as gpt
-import module.gemini as gemini
+import module.cache as cache
+# gpt / gemini(google.genai)는 무거우므로 실제로 필요한 곳에서만 import
 
 # ---------------------------------------------------
 # Streamlit config
@@ -58,6 +58,8 @@ if st.sidebar.button("Save"):
         "04": {"AI Comment": ""}
     }
     # API 키 체크
+    import module.gpt as gpt
+    import module.gemini as gemini
     if gpt.api_check(api_key):
         options["api_key"] = api_key
         options["api_type"] = "GPT"
@@ -103,3 +105,41 @@ if options["api_key"] and options["repository_url"]:
     st.success("✅️ API KEY와 GitHub URL가 확인되었습니다. 왼쪽 사이드바에서 분석 페이지로 이동하세요!")
 else:
     st.error("⛔ API KEY와 GitHub URL를 입력해야 합니다.")
+
+# ---------------------------------------------------
+# Analyze all (Gemini 분석을 동시에 실행)
+# ---------------------------------------------------
+if options["api_key"] and options["repository_url"] and options["api_type"] == "GEMINI":
+    if st.button("🚀 Analyze all"):
+        with st.spinner("Wait for it...", show_time=True):
+            import module.gemini as gemini
+            try:
+                repository_data = cache.url_repository_data(options["repository_url"])
+                file_tree = cache.url_tree_string(options["repository_url"])
+            except cache.FetchError as e:
+                st.error(str(e))
+                st.stop()
+            try:
+                source_code = cache.download_source_zip(options["repository_url"])
+            except cache.FetchError:
+                # 소스 코드 없이 파일 트리만으로 분석
+                source_code = None
+            results = gemini.api_run_all(
+                options["api_key"],
+                repository_data.get("tree_dict"),
+                repository_data.get("readme"),
+                source_code,
+                _language=options["language"]
+            )
+            contents["01"]["File Tree"] = file_tree
+            failed = False
+            for page, ai_comment in results.items():
+                # 실패 결과는 저장하지 않아 결과 페이지에서 다시 시도
+                if not ai_comment or ai_comment.startswith(cache.ERROR_PREFIX):
+                    st.error(f"{page}: {ai_comment or cache.AI_ERROR_MESSAGE}")
+                    failed = True
+                    continue
+                contents[page]["AI Comment"] = ai_comment
+            st.session_state["contents"] = contents
+        if not failed:
+            st.success("✅️ 분석이 완료되었습니다. 왼쪽 사이드바에서 결과 페이지로 이동하세요!")
@@ -0,0 +1,144 @@
+# module/cache.py
+
+# ---------------------------------------------------
+# Import module
+# ---------------------------------------------------
+import streamlit as st
+import module.github as github
+# gpt / gemini는 AI 결과가 캐시에 없을 때만 import (google.genai 로딩 지연)
+
+# ---------------------------------------------------
+# Streamlit 캐시 설정
+# ---------------------------------------------------
+# Streamlit은 위젯을 조작할 때마다 스크립트 전체를 다시 실행하므로
+# 같은 인자로 호출된 GitHub / AI 결과는 캐시에서 바로 반환
+CACHE_TTL = 900
+
+# gpt / gemini가 실패 시 반환하는 문자열의 접두어
+ERROR_PREFIX = "Error: "
+GITHUB_ERROR_MESSAGE = ERROR_PREFIX + "GitHub 저장소 정보를 가져오지 못했습니다."
+AI_ERROR_MESSAGE = ERROR_PREFIX + "AI 응답을 받지 못했습니다."
+
+
+class FetchError(Exception):
+    """
+    GitHub / AI 호출 실패
+    st.cache_data는 예외가 발생한 호출을 캐시하지 않으므로
+    실패 결과(None, "Error: ...")는 반환하지 않고 예외로 올려 다음 실행에서 다시 시도
+    """
+    def __init__(self, message: str = GITHUB_ERROR_MESSAGE):
+        super().__init__(message)
+
+
+def _check(result, _message: str = GITHUB_ERROR_MESSAGE):
+    """
+    실패 결과면 FetchError 발생, 아니면 그대로 반환
+    - None → _message
+    - "Error: ..." 문자열 → 그 문자열
+    """
+    if result is None:
+        raise FetchError(_message)
+    if isinstance(result, str) and result.startswith(ERROR_PREFIX):
+        raise FetchError(result)
+    return result
+
+
+# ---------------------------------------------------
+# GitHub
+# ---------------------------------------------------
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def url_branch_list(url: str) -> list:
+    return github.url_branch_list(url)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def url_readme_string(url: str) -> str | None:
+    # README가 없는 저장소도 None이므로 그대로 캐시
+    return github.url_readme_string(url)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def url_tree_dict(url: str) -> dict:
+    return _check(github.url_tree_dict(url))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def url_tree_string(url: str) -> str:
+    return _check(github.url_tree_string(url))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def url_repository_data(url: str) -> dict:
+    result = _check(github.url_repository_data(url))
+    # 트리 요청만 실패해도 dict가 반환되므로 따로 확인
+    if result["tree_dict"] is None:
+        raise FetchError()
+    return result
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def download_source_zip(url: str) -> dict:
+    return _check(github.download_source_zip(url))
+
+
+def clear_github() -> None:
+    """
+    GitHub 캐시 전체 비우기 (새로고침용)
+    """
+    url_branch_list.clear()
+    url_readme_string.clear()
+    url_tree_dict.clear()
+    url_tree_string.clear()
+    url_repository_data.clear()
+    download_source_zip.clear()
+
+
+# ---------------------------------------------------
+# AI (api_type에 따라 GPT / Gemini 호출)
+# ---------------------------------------------------
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def api_repository_structure(api_type: str, api_key: str, url: str, language: str) -> str:
+    """
+    저장소 구조 분석
+    """
+    tree_dict = url_tree_dict(url)
+    if api_type == "GPT":
+        import module.gpt as gpt
+        return _check(gpt.api_repository_structure(api_key, tree_dict, language), AI_ERROR_MESSAGE)
+    elif api_type == "GEMINI":
+        import module.gemini as gemini
+        return _check(gemini.api_repository_structure(api_key, tree_dict, language), AI_ERROR_MESSAGE)
+    return ""
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def api_environment_setup(api_type: str, api_key: str, url: str, language: str) -> str:
+    """
+    환경 설정 가이드 생성
+    """
+    repository_data = url_repository_data(url)
+    tree_dict = repository_data.get("tree_dict")
+    readme = repository_data.get("readme")
+    if api_type == "GPT":
+        import module.gpt as gpt
+        return _check(gpt.api_environment_setup(api_key, tree_dict, readme, language), AI_ERROR_MESSAGE)
+    elif api_type == "GEMINI":
+        import module.gemini as gemini
+        return _check(gemini.api_environment_setup(api_key, tree_dict, readme, language), AI_ERROR_MESSAGE)
+    return ""
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def api_code_flow_analysis(api_type: str, api_key: str, url: str, language: str) -> str:
+    """
+    코드 흐름 분석 (Gemini 전용)
+    """
+    if api_type == "GEMINI":
+        import module.gemini as gemini
+        try:
+            source_code = download_source_zip(url)
+        except FetchError:
+            # 소스 코드 없이 파일 트리만으로 분석
+            source_code = None
+        return _check(gemini.api_code_flow_analysis(api_key, url_tree_dict(url), source_code, language), AI_ERROR_MESSAGE)
+    return "코드 흐름 분석은 Gemini API 키에서만 지원됩니다."
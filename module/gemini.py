@@ -7,9 +7,55 @@
 # ---------------------------------------------------
 # Import module
 # ---------------------------------------------------
+import os
+import re
 import json
+import time
+import hashlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from google import genai
 from google.genai import types
+from google.genai import errors
+
+# ---------------------------------------------------
+# 공통 설정
+# ---------------------------------------------------
+GEMINI_MODEL = "gemini-2.5-flash"
+
+# 분석 결과가 입력에 대해 결정적이도록 고정 (같은 입력 → 같은 출력 → 응답 캐시 재사용)
+GEMINI_TEMPERATURE = 0
+GEMINI_SEED = 0
+
+# 응답 캐시 저장 위치 / 버전 (버전 변경 시 기존 캐시 무효화)
+LLM_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".llm_cache")
+LLM_CACHE_VERSION = "1"
+
+# 파일 트리 컨텍스트 캐시(Gemini caches API) 설정
+TREE_CACHE_TTL = 600            # 초
+TREE_CACHE_MIN_TOKENS = 1024    # 모델 최소 캐시 크기 미만이면 캐시 생성 생략
+
+# 코드 흐름 분석에 포함할 소스 코드 토큰 예산
+SOURCE_TOKEN_BUDGET = 30000         # 전체
+SOURCE_FILE_TOKEN_LIMIT = 2000      # 파일 하나당 (큰 파일 하나가 예산을 독차지하지 않도록)
+
+# 진입점으로 보이는 파일 이름 패턴
+_ENTRYPOINT_PATTERN = re.compile(r"(^|/)(main|app|index|__init__|__main__|server|manage|cli|run|home)\.[^/]*$", re.IGNORECASE)
+# import 대상 모듈 이름 (Python: import x / from x, JS/TS: from 'x' / require('x') / import 'x')
+_IMPORT_PATTERN = re.compile(
+    r"""^\s*(?:from\s+([\w.]+)\s+import\b|import\s+([\w.]+)(?=\s*(?:$|,|;|as\b)))"""
+    r"""|(?:from|require\(|import)\s*['"]([^'"]+)['"]""",
+    re.MULTILINE
+)
+SOURCE_SCORE_MAX_FILES = 300       # import 분석까지 하는 파일 수 (나머지는 이름/깊이 순서로 뒤에 붙임)
+
+# 생성된 컨텍스트 캐시 메모 {해시: (cache.name | None, 만료 시각)}
+_TREE_CACHES: dict = {}
+_TREE_CACHES_LOCK = threading.Lock()
+
+# API 키 검사 결과 메모 {키의 SHA-256: bool} (원본 키는 저장하지 않음)
+_API_CHECK_RESULTS: dict = {}
 
 # ---------------------------------------------------
 # System Instructions (프롬프트 중앙 관리)
@@ -63,9 +109,420 @@ Your task:
 You must answer in {language}."""
 }
 
+@functools.lru_cache(maxsize=64)
+def _sysinst(_prompt_key: str, _language: str) -> str:
+    """
+    언어 설정이 적용된 시스템 프롬프트 (프롬프트 키 / 언어별로 한 번만 생성)
+    """
+    return SYSTEM_PROMPTS[_prompt_key].format(language=_language)
+
+
+# ---------------------------------------------------
+# Prompt Templates (정적 부분만 정의, 가변 데이터는 뒤에 덧붙임)
+# ---------------------------------------------------
+# 저장소 구조 분석 요청
+REPOSITORY_STRUCTURE_PROMPT = """Analyze the repository file tree structure provided.
+
+Please provide:
+1. **Entry Point**: Main files to start the application
+2. **Languages Used**: Primary programming languages
+3. **Directory Structure**: Purpose of each directory
+4. **Code Organization**: Quality assessment and suggestions
+5. **Project Type**: Web app, CLI tool, library, etc."""
+
+# 환경 설정 가이드 요청
+ENVIRONMENT_SETUP_PROMPT = """Based on the README and file structure provided, create a comprehensive setup guide.
+
+Please provide:
+1. **System Requirements**: OS, software versions
+2. **Installation Steps**: Numbered, detailed instructions
+3. **Configuration**: Environment variables, config files
+4. **Running the Application**: Commands to start
+5. **Troubleshooting**: Common issues and solutions"""
+
+# 코드 흐름 분석 요청
+CODE_FLOW_PROMPT = """Analyze the code flow and execution path of this project, using the file structure and source code provided.
+
+Please provide:
+1. **Execution Flow**: Step-by-step execution path from entry point
+2. **Module Dependencies**: How modules depend on each other
+3. **Data Flow**: How data moves through the application
+4. **Key Functions**: Important functions and their roles
+5. **Interaction Diagram**: Describe how components interact
+6. **Critical Paths**: Performance bottlenecks or important execution paths
+7. **Recommendations**: Suggestions for improving code flow"""
+
+# 이슈 요약 요청
+ISSUE_SUMMARY_PROMPT = """Analyze and summarize the project issues provided.
+
+Please provide:
+1. **Overall Summary**: High-level overview of all issues
+2. **Categorization**: Group by type (bugs, features, enhancements, etc.)
+3. **Priority Analysis**: Identify high-priority issues
+4. **Common Themes**: Recurring patterns or related issues
+5. **Statistics**: Count of each issue type
+6. **Action Items**: Recommended next steps
+7. **Critical Issues**: Issues that need immediate attention
+
+Format the response in a clear, structured way."""
+
+# ---------------------------------------------------
+# Client
+# ---------------------------------------------------
+@functools.lru_cache(maxsize=4)
+def _client(_key: str) -> genai.Client:
+    """
+    API 키별 Gemini 클라이언트 재사용 (HTTP 연결 / 인증 초기화 1회)
+    """
+    return genai.Client(api_key=_key)
+
+
+# ---------------------------------------------------
+# File Tree Serialization
+# ---------------------------------------------------
+def _tree_to_compact(_tree: dict) -> str:
+    """
+    파일 트리 dict를 들여쓰기 목록으로 변환 (폴더는 이름 뒤에 "/")
+    예: {"src": {"main.py": None}, "README.md": None}
+        → "src/\n  main.py\nREADME.md"
+    """
+    lines = []
+    # (노드, 깊이) 스택으로 순회 (원래 순서 유지)
+    stack = [(iter(_tree.items()), 0)]
+    while stack:
+        items, depth = stack[-1]
+        entry = next(items, None)
+        if entry is None:
+            stack.pop()
+            continue
+        name, child = entry
+        if isinstance(child, dict):
+            lines.append("  " * depth + name + "/")
+            stack.append((iter(child.items()), depth + 1))
+        else:
+            lines.append("  " * depth + name)
+    return "\n".join(lines)
+
+
+def _tree_block(_file_tree: dict) -> str:
+    """
+    프롬프트에 넣을 파일 트리 블록
+    (세 분석이 같은 컨텍스트 캐시를 공유하도록 항상 같은 문자열을 만듦)
+    """
+    return f"""File Structure (folders end with "/"):
+```
+{_tree_to_compact(_file_tree)}
+```"""
+
+
+# ---------------------------------------------------
+# Source Packing (토큰 예산 안에서 중요한 파일부터 포함)
+# ---------------------------------------------------
+def _estimate_tokens(_text: str) -> int:
+    """
+    토큰 수 대략 추정 (4글자 ≈ 1토큰)
+    """
+    return len(_text) // 4
+
+
+def _path_score(_name: str) -> int:
+    """
+    경로만 보고 매기는 점수
+    - 진입점 이름(main, app, index, __init__ 등)이면 가산
+    - 얕은 경로일수록 가산
+    """
+    score = 100 if _ENTRYPOINT_PATTERN.search(_name) else 0
+    return score - _name.count("/")
+
+
+def _imported_names(_source_code: dict) -> dict:
+    """
+    모듈 이름 → 그 모듈을 import 하는 파일 수
+    (module.github → module, github / ./utils/helper → utils, helper 처럼 경로 조각 단위)
+    """
+    counts = {}
+    for code in _source_code.values():
+        names = set()
+        for match in _IMPORT_PATTERN.finditer(str(code)):
+            module = match.group(1) or match.group(2) or match.group(3)
+            names.update(part for part in re.split(r"[./@]", module) if part)
+        for name in names:
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def _entrypoint_score(_name: str, _imported: dict) -> int:
+    """
+    파일 중요도 점수
+    - 경로 점수 (_path_score)
+    - 다른 파일에서 import 될수록 가산
+    """
+    score = _path_score(_name)
+    stem = os.path.splitext(os.path.basename(_name))[0]
+    if stem and stem != "__init__":
+        score += 10 * _imported.get(stem, 0)
+    return score
+
+
+def _pack_source(_source_code: dict, _budget_tokens: int = SOURCE_TOKEN_BUDGET) -> str:
+    """
+    중요도 순으로 정렬한 소스 코드를 토큰 예산이 찰 때까지 이어 붙임
+    """
+    # 경로 점수로 후보를 먼저 추리고, 후보만 import 관계로 다시 정렬
+    by_path = sorted(_source_code, key=_path_score, reverse=True)
+    candidates = by_path[:SOURCE_SCORE_MAX_FILES]
+    imported = _imported_names({name: _source_code[name] for name in candidates})
+    ranked = sorted(candidates, key=lambda name: _entrypoint_score(name, imported), reverse=True)
+    ranked += by_path[SOURCE_SCORE_MAX_FILES:]
+
+    parts = []
+    remaining = _budget_tokens
+    for name in ranked:
+        code = str(_source_code[name])
+        header = f"\n--- {name} ---\n"
+        # 파일당 한도 / 남은 예산 중 작은 쪽으로 자르기
+        limit = min(SOURCE_FILE_TOKEN_LIMIT, remaining - _estimate_tokens(header))
+        if limit <= 0:
+            break
+        code = code[:limit * 4]
+        parts.append(header + code + "\n")
+        remaining -= _estimate_tokens(header) + _estimate_tokens(code)
+
+    return "".join(parts)
+
+
+# ---------------------------------------------------
+# Response Cache
+# ---------------------------------------------------
+def _cache_key(_system_instruction: str, _prompt: str, _temperature: float) -> str:
+    """
+    모델/시스템 프롬프트/요청 프롬프트로 캐시 키(SHA-256) 생성
+    """
+    payload = json.dumps({
+        "version": LLM_CACHE_VERSION,
+        "model": GEMINI_MODEL,
+        "system_instruction": _system_instruction,
+        "prompt": _prompt,
+        "temperature": _temperature,
+        "seed": GEMINI_SEED,
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_load(_cache_key: str) -> str | None:
+    """
+    디스크 캐시에서 응답 텍스트 읽기 (없으면 None)
+    """
+    path = os.path.join(LLM_CACHE_DIR, _cache_key + ".txt")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _cache_save(_cache_key: str, _text: str) -> None:
+    """
+    응답 텍스트를 디스크 캐시에 저장 (실패해도 무시)
+    """
+    path = os.path.join(LLM_CACHE_DIR, _cache_key + ".txt")
+    try:
+        os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체 (동시 실행 시 반쯤 쓰인 파일 방지)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(_text)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+
+
+# ---------------------------------------------------
+# Context Cache (파일 트리)
+# ---------------------------------------------------
+def _tree_hash(_key: str, _parsed_file_tree: str) -> str:
+    """
+    컨텍스트 캐시 식별용 해시 (캐시는 API 키별로 분리되므로 키도 포함)
+    """
+    return hashlib.sha256((_key + "\n" + _parsed_file_tree).encode("utf-8")).hexdigest()
+
+
+def _get_or_create_tree_cache(_client: genai.Client, _file_tree_hash: str, _file_tree_block: str) -> str | None:
+    """
+    파일 트리 블록을 Gemini 컨텍스트 캐시로 등록하고 cache.name 반환
+    - 시스템 프롬프트는 분석마다 다르므로 캐시에 넣지 않음 → 세 분석이 같은 캐시를 공유
+    - 트리가 너무 작거나 생성 실패 시 None → 프롬프트에 직접 포함
+    """
+    # api_run_all에서 동시에 호출돼도 캐시는 한 번만 생성
+    with _TREE_CACHES_LOCK:
+        now = time.time()
+        memo = _TREE_CACHES.get(_file_tree_hash)
+        if memo is not None and memo[1] > now:
+            return memo[0]
+
+        cache_name = None
+        if _estimate_tokens(_file_tree_block) >= TREE_CACHE_MIN_TOKENS:
+            try:
+                cache = _client.caches.create(
+                    model=GEMINI_MODEL,
+                    config=types.CreateCachedContentConfig(
+                        contents=[_file_tree_block],
+                        ttl=f"{TREE_CACHE_TTL}s"
+                    )
+                )
+                cache_name = cache.name
+            except Exception:
+                cache_name = None
+
+        # 만료 직전 사용을 피하기 위해 여유 시간(30초)을 둠 (실패도 TTL 동안 기억)
+        _TREE_CACHES[_file_tree_hash] = (cache_name, now + TREE_CACHE_TTL - 30)
+        return cache_name
+
+
+def _is_missing_cache_error(_error: Exception) -> bool:
+    """
+    컨텍스트 캐시가 만료/삭제되어 생긴 에러인지 확인 (이 경우에만 일반 요청으로 재시도)
+    """
+    if not isinstance(_error, errors.ClientError):
+        return False
+    if _error.code == 404:
+        return True
+    # 만료된 캐시는 403(permission denied)으로 응답되기도 함
+    return _error.code == 403 and "cachedcontent" in str(_error.message).lower()
+
+
+def _drop_tree_cache(_cache_name: str) -> None:
+    """
+    사용할 수 없게 된 컨텍스트 캐시를 메모에서 제거
+    """
+    with _TREE_CACHES_LOCK:
+        for memo_key, memo in list(_TREE_CACHES.items()):
+            if memo[0] == _cache_name:
+                del _TREE_CACHES[memo_key]
+
+
+def _generate_content(_client: genai.Client, _system_instruction: str, _prompt: str, _temperature: float,
+                      _file_tree_block: str | None = None, _file_tree_hash: str | None = None) -> str:
+    """
+    캐시를 거쳐 Gemini 응답 텍스트 반환
+    (같은 입력이면 API를 다시 호출하지 않음)
+
+    _file_tree_block이 주어지면 컨텍스트 캐시로 보내고
+    요청에는 시스템 프롬프트 + 질문(_prompt)만 포함
+    """
+    # 정적인 질문 템플릿이 앞, 가변 데이터(파일 트리)가 뒤 → 암묵적 prefix 캐시 적중
+    full_prompt = _prompt if _file_tree_block is None else _prompt + "\n\n" + _file_tree_block
+
+    cache_key = _cache_key(_system_instruction, full_prompt, _temperature)
+    cached = _cache_load(cache_key)
+    if cached is not None:
+        return cached
+
+    response = None
+    if _file_tree_block is not None and _file_tree_hash:
+        cache_name = _get_or_create_tree_cache(_client, _file_tree_hash, _file_tree_block)
+        if cache_name:
+            try:
+                response = _client.models.generate_content(
+                    model=GEMINI_MODEL,
+                    config=types.GenerateContentConfig(
+                        cached_content=cache_name,
+                        temperature=_temperature,
+                        seed=GEMINI_SEED
+                    ),
+                    # 캐시를 쓰는 요청에는 system_instruction을 설정할 수 없으므로 질문 앞에 포함
+                    contents=_system_instruction + "\n\n" + _prompt
+                )
+            except errors.ClientError as e:
+                # 서버 측에서 캐시가 만료/삭제된 경우에만 메모 제거 후 일반 요청
+                if not _is_missing_cache_error(e):
+                    raise
+                _drop_tree_cache(cache_name)
+                response = None
+
+    if response is None:
+        response = _client.models.generate_content(
+            model=GEMINI_MODEL,
+            config=types.GenerateContentConfig(
+                system_instruction=_system_instruction,
+                temperature=_temperature,
+                seed=GEMINI_SEED
+            ),
+            contents=full_prompt
+        )
+    text = response.text
+    # 빈 응답(차단 등)은 캐시하지 않음
+    if text:
+        _cache_save(cache_key, text)
+    return text
+
+
+def _generate_content_stream(_client: genai.Client, _system_instruction: str, _prompt: str, _temperature: float,
+                             _file_tree_block: str | None = None, _file_tree_hash: str | None = None):
+    """
+    _generate_content의 스트리밍 버전 (응답 조각을 받는 대로 yield)
+    캐시 적중 시 전체 텍스트를 한 번에 yield, 완료된 응답은 캐시에 저장
+    """
+    full_prompt = _prompt if _file_tree_block is None else _prompt + "\n\n" + _file_tree_block
+
+    cache_key = _cache_key(_system_instruction, full_prompt, _temperature)
+    cached = _cache_load(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    chunks = []
+    cache_name = None
+    if _file_tree_block is not None and _file_tree_hash:
+        cache_name = _get_or_create_tree_cache(_client, _file_tree_hash, _file_tree_block)
+    if cache_name:
+        try:
+            for chunk in _client.models.generate_content_stream(
+                model=GEMINI_MODEL,
+                config=types.GenerateContentConfig(
+                    cached_content=cache_name,
+                    temperature=_temperature,
+                    seed=GEMINI_SEED
+                ),
+                contents=_system_instruction + "\n\n" + _prompt
+            ):
+                if chunk.text:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+        except errors.ClientError as e:
+            # 이미 일부를 보냈거나 캐시 만료가 아닌 에러는 그대로 에러 처리
+            if chunks or not _is_missing_cache_error(e):
+                raise
+            _drop_tree_cache(cache_name)
+            cache_name = None
+
+    if not cache_name:
+        for chunk in _client.models.generate_content_stream(
+            model=GEMINI_MODEL,
+            config=types.GenerateContentConfig(
+                system_instruction=_system_instruction,
+                temperature=_temperature,
+                seed=GEMINI_SEED
+            ),
+            contents=full_prompt
+        ):
+            if chunk.text:
+                chunks.append(chunk.text)
+                yield chunk.text
+
+    text = "".join(chunks)
+    if text:
+        _cache_save(cache_key, text)
+
+
 # ---------------------------------------------------
 # Function
 # ---------------------------------------------------
+class StreamError(Exception):
+    """
+    스트리밍 분석 실패 (메시지는 "Error: ..." 형식)
+    """
+
+
 def api_check(_key: str) -> bool:
     """
     Gemini API 키 유효성 검사
@@ -80,20 +537,42 @@ def api_check(_key: str) -> bool:
     if not _key or not isinstance(_key, str):
         return False
     
+    # 같은 키는 결과가 바뀌지 않으므로 이전 검사 결과 재사용
+    key_hash = hashlib.sha256(_key.encode("utf-8")).hexdigest()
+    if key_hash in _API_CHECK_RESULTS:
+        return _API_CHECK_RESULTS[key_hash]
+    
     try:
-        # Gemini 클라이언트 생성
-        client = genai.Client(api_key=_key)
-        # 테스트 요청 전송
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            config=types.GenerateContentConfig(
-                system_instruction="You must answer in English."
-            ),
-            contents="ping"
-        )
-        return True
+        # Gemini 클라이언트 (키별로 재사용)
+        client = _client(_key)
+        # 모델 정보 조회로 인증만 확인 (토큰 소모 없음)
+        client.models.get(model=GEMINI_MODEL)
+        result = True
+    except errors.ClientError as e:
+        # 잘못된 키(400/401/403)만 기억, 429 등은 다음에 다시 검사
+        if e.code not in (400, 401, 403):
+            return False
+        result = False
     except Exception as e:
+        # 네트워크 오류 등 일시적인 실패는 기억하지 않음
         return False
+    
+    _API_CHECK_RESULTS[key_hash] = result
+    return result
+
+
+def _repository_structure_prompt(_file_tree: dict, _language: str) -> tuple:
+    """
+    저장소 구조 분석용 (시스템 프롬프트, 요청 프롬프트, 파일 트리 블록) 생성
+    """
+    # 시스템 프롬프트에 언어 설정 적용 (키/언어별로 재사용)
+    system_instruction = _sysinst("repository_analyzer", _language)
+    
+    # 파일 트리 블록 (컨텍스트 캐시 대상, 모든 분석에서 동일)
+    file_tree_block = _tree_block(_file_tree)
+
+    # 분석 요청 프롬프트 생성 (정적 템플릿)
+    return system_instruction, REPOSITORY_STRUCTURE_PROMPT, file_tree_block
 
 
 def api_repository_structure(_key: str, _file_tree: dict, _language: str = "English") -> str:
@@ -112,47 +591,50 @@ def api_repository_structure(_key: str, _file_tree: dict, _language: str = "Engl
     if not _key or not _file_tree:
         return "Error: Invalid input"
     
-    # 파일 트리를 JSON 문자열로 변환
-    try:
-        parsed_file_tree = json.dumps(_file_tree, indent=2, ensure_ascii=False)
-    except:
-        parsed_file_tree = str(_file_tree)
-    
     try:
-        # Gemini 클라이언트 생성
-        client = genai.Client(api_key=_key)
+        # Gemini 클라이언트 (키별로 재사용)
+        client = _client(_key)
         
-        # 시스템 프롬프트에 언어 설정 적용
-        system_instruction = SYSTEM_PROMPTS["repository_analyzer"].format(
-            language=_language
-        )
+        # 시스템 프롬프트 / 요청 프롬프트 / 파일 트리 블록 생성
+        system_instruction, prompt, file_tree_block = _repository_structure_prompt(_file_tree, _language)
+
+        # AI 요청 전송 및 응답 반환 (캐시 적중 시 API 호출 생략)
+        return _generate_content(client, system_instruction, prompt, GEMINI_TEMPERATURE,
+                                 file_tree_block, _tree_hash(_key, file_tree_block))
         
-        # 분석 요청 프롬프트 생성
-        prompt = f"""Analyze this repository file tree structure:
-```json
-{parsed_file_tree}
-```
+    except Exception as e:
+        return f"Error: {str(e)}"
 
-Please provide:
-1. **Entry Point**: Main files to start the application
-2. **Languages Used**: Primary programming languages
-3. **Directory Structure**: Purpose of each directory
-4. **Code Organization**: Quality assessment and suggestions
-5. **Project Type**: Web app, CLI tool, library, etc."""
 
-        # AI 요청 전송 및 응답 반환
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                temperature=0.7
-            ),
-            contents=prompt
-        )
-        return response.text
+def api_repository_structure_stream(_key: str, _file_tree: dict, _language: str = "English"):
+    """
+    저장소 구조 분석 (스트리밍)
+    응답 조각을 받는 대로 yield → st.write_stream으로 바로 표시
+    
+    Args:
+        _key: Gemini API 키
+        _file_tree: 파일 트리 구조 (dict)
+        _language: 응답 언어 (기본값: English)
+    
+    Yields:
+        str: 분석 결과 조각
+    
+    Raises:
+        StreamError: 입력값이 잘못되었거나 응답 도중 실패한 경우
+                     (일부 조각을 보낸 뒤일 수 있으므로 에러 문자열 대신 예외로 알림)
+    """
+    # 입력값 검증
+    if not _key or not _file_tree:
+        raise StreamError("Error: Invalid input")
+    
+    try:
+        client = _client(_key)
+        system_instruction, prompt, file_tree_block = _repository_structure_prompt(_file_tree, _language)
+        yield from _generate_content_stream(client, system_instruction, prompt, GEMINI_TEMPERATURE,
+                                            file_tree_block, _tree_hash(_key, file_tree_block))
         
     except Exception as e:
-        return f"Error: {str(e)}"
+        raise StreamError(f"Error: {str(e)}") from e
 
 
 def api_environment_setup(_key: str, _file_tree: dict, _readme: str, _language: str = "English") -> str:
@@ -172,53 +654,29 @@ def api_environment_setup(_key: str, _file_tree: dict, _readme: str, _language:
     if not _key or not _file_tree:
         return "Error: Invalid input"
     
-    # 파일 트리를 JSON 문자열로 변환
-    try:
-        parsed_file_tree = json.dumps(_file_tree, indent=2, ensure_ascii=False)
-    except:
-        parsed_file_tree = str(_file_tree)
-    
     # README 없을 시 기본 메시지 설정
     if not _readme:
         _readme = "(No README file found)"
     
     try:
-        # Gemini 클라이언트 생성
-        client = genai.Client(api_key=_key)
+        # Gemini 클라이언트 (키별로 재사용)
+        client = _client(_key)
         
-        # 시스템 프롬프트에 언어 설정 적용
-        system_instruction = SYSTEM_PROMPTS["environment_guide"].format(
-            language=_language
-        )
+        # 시스템 프롬프트에 언어 설정 적용 (키/언어별로 재사용)
+        system_instruction = _sysinst("environment_guide", _language)
         
-        # 환경 설정 가이드 생성 프롬프트
-        prompt = f"""Based on the following information, create a comprehensive setup guide:
+        # 파일 트리 블록 (컨텍스트 캐시 대상, 모든 분석에서 동일)
+        file_tree_block = _tree_block(_file_tree)
 
-README:
-{_readme}
-
-File Structure:
-```json
-{parsed_file_tree}
-```
+        # 환경 설정 가이드 생성 프롬프트 (정적 템플릿 뒤에 README를 덧붙임)
+        prompt = ENVIRONMENT_SETUP_PROMPT + f"""
 
-Please provide:
-1. **System Requirements**: OS, software versions
-2. **Installation Steps**: Numbered, detailed instructions
-3. **Configuration**: Environment variables, config files
-4. **Running the Application**: Commands to start
-5. **Troubleshooting**: Common issues and solutions"""
+README:
+{_readme}"""
 
-        # AI 요청 전송 및 응답 반환
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                temperature=0.5
-            ),
-            contents=prompt
-        )
-        return response.text
+        # AI 요청 전송 및 응답 반환 (캐시 적중 시 API 호출 생략)
+        return _generate_content(client, system_instruction, prompt, GEMINI_TEMPERATURE,
+                                 file_tree_block, _tree_hash(_key, file_tree_block))
         
     except Exception as e:
         return f"Error: {str(e)}"
@@ -242,57 +700,28 @@ def api_code_flow_analysis(_key: str, _file_tree: dict, _source_code: dict = Non
     if not _key or not _file_tree:
         return "Error: Invalid input"
     
-    # 파일 트리를 JSON 문자열로 변환
-    try:
-        parsed_file_tree = json.dumps(_file_tree, indent=2, ensure_ascii=False)
-    except:
-        parsed_file_tree = str(_file_tree)
-    
     # 소스 코드가 제공된 경우 프롬프트에 추가
     source_info = ""
     if _source_code and isinstance(_source_code, dict):
-        source_info = "\n\nSource Code Samples:\n"
-        for filename, code in _source_code.items():
-            # 각 파일의 첫 1000자만 포함
-            source_info += f"\n--- {filename} ---\n{code[:1000]}\n"
+        # 진입점 / 많이 참조되는 파일부터 토큰 예산 안에서 포함
+        source_info = "\n\nSource Code Samples:\n" + _pack_source(_source_code)
     
     try:
-        # Gemini 클라이언트 생성
-        client = genai.Client(api_key=_key)
+        # Gemini 클라이언트 (키별로 재사용)
+        client = _client(_key)
         
-        # 시스템 프롬프트에 언어 설정 적용
-        system_instruction = SYSTEM_PROMPTS["code_flow_analyzer"].format(
-            language=_language
-        )
+        # 시스템 프롬프트에 언어 설정 적용 (키/언어별로 재사용)
+        system_instruction = _sysinst("code_flow_analyzer", _language)
         
-        # 코드 흐름 분석 프롬프트
-        prompt = f"""Analyze the code flow and execution path of this project:
-
-File Structure:
-```json
-{parsed_file_tree}
-```
-{source_info}
+        # 파일 트리 블록 (컨텍스트 캐시 대상, 모든 분석에서 동일)
+        file_tree_block = _tree_block(_file_tree)
 
-Please provide:
-1. **Execution Flow**: Step-by-step execution path from entry point
-2. **Module Dependencies**: How modules depend on each other
-3. **Data Flow**: How data moves through the application
-4. **Key Functions**: Important functions and their roles
-5. **Interaction Diagram**: Describe how components interact
-6. **Critical Paths**: Performance bottlenecks or important execution paths
-7. **Recommendations**: Suggestions for improving code flow"""
+        # 코드 흐름 분석 프롬프트 (정적 템플릿 뒤에 소스 코드를 덧붙임)
+        prompt = CODE_FLOW_PROMPT + source_info
 
-        # AI 요청 전송 및 응답 반환
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                temperature=0.6
-            ),
-            contents=prompt
-        )
-        return response.text
+        # AI 요청 전송 및 응답 반환 (캐시 적중 시 API 호출 생략)
+        return _generate_content(client, system_instruction, prompt, GEMINI_TEMPERATURE,
+                                 file_tree_block, _tree_hash(_key, file_tree_block))
         
     except Exception as e:
         return f"Error: {str(e)}"
@@ -325,41 +754,52 @@ def api_issue_summary(_key: str, _issues: list, _language: str = "English") -> s
         parsed_issues = str(_issues)
     
     try:
-        # Gemini 클라이언트 생성
-        client = genai.Client(api_key=_key)
+        # Gemini 클라이언트 (키별로 재사용)
+        client = _client(_key)
         
-        # 시스템 프롬프트에 언어 설정 적용
-        system_instruction = SYSTEM_PROMPTS["issue_summarizer"].format(
-            language=_language
-        )
+        # 시스템 프롬프트에 언어 설정 적용 (키/언어별로 재사용)
+        system_instruction = _sysinst("issue_summarizer", _language)
         
-        # 이슈 분석 프롬프트
-        prompt = f"""Analyze and summarize the following project issues:
+        # 이슈 분석 프롬프트 (정적 템플릿 뒤에 이슈 목록을 덧붙임)
+        prompt = ISSUE_SUMMARY_PROMPT + f"""
+
+Issues:
 ```json
 {parsed_issues}
-```
-
-Please provide:
-1. **Overall Summary**: High-level overview of all issues
-2. **Categorization**: Group by type (bugs, features, enhancements, etc.)
-3. **Priority Analysis**: Identify high-priority issues
-4. **Common Themes**: Recurring patterns or related issues
-5. **Statistics**: Count of each issue type
-6. **Action Items**: Recommended next steps
-7. **Critical Issues**: Issues that need immediate attention
-
-Format the response in a clear, structured way."""
+```"""
 
-        # AI 요청 전송 및 응답 반환
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                temperature=0.5
-            ),
-            contents=prompt
-        )
-        return response.text
+        # AI 요청 전송 및 응답 반환 (캐시 적중 시 API 호출 생략)
+        return _generate_content(client, system_instruction, prompt, GEMINI_TEMPERATURE)
         
     except Exception as e:
         return f"Error: {str(e)}"
+
+
+def api_run_all(_key: str, _file_tree: dict, _readme: str = None, _source_code: dict = None,
+                _issues: list = None, _language: str = "English") -> dict:
+    """
+    4가지 분석을 동시에 실행 (서로 독립적인 네트워크 요청이므로 병렬 처리)
+    
+    Args:
+        _key: Gemini API 키
+        _file_tree: 파일 트리 구조
+        _readme: README 파일 내용
+        _source_code: 소스 코드 내용 (선택적)
+        _issues: 이슈 목록 (없으면 이슈 요약 생략)
+        _language: 응답 언어
+    
+    Returns:
+        dict: 페이지 번호별 분석 결과
+              예: {"01": "...", "02": "...", "03": "...", "04": "..."}
+    """
+    tasks = {
+        "01": (api_repository_structure, (_key, _file_tree, _language)),
+        "02": (api_environment_setup, (_key, _file_tree, _readme, _language)),
+        "03": (api_code_flow_analysis, (_key, _file_tree, _source_code, _language)),
+    }
+    if _issues:
+        tasks["04"] = (api_issue_summary, (_key, _issues, _language))
+    
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {name: executor.submit(fn, *args) for name, (fn, args) in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
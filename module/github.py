@@ -4,36 +4,94 @@
 # Import module
 # ---------------------------------------------------
 import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+import functools
 import requests
-from urllib.parse import urlparse
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
+import io
+import posixpath
+import zipfile
 
 # ---------------------------------------------------
 # GitHub API 공통 설정 / 유틸
 # ---------------------------------------------------
 GITHUB_API_BASE = "https://api.github.com"
-
-
+GITHUB_GRAPHQL_URL = GITHUB_API_BASE + "/graphql"
+
+# 저장소 URL 패턴: https://github.com/{owner}/{repo}[/...|?...|#...|;...] (urlparse 기반 파싱과 같은 결과)
+_REPO_URL_PATTERN = re.compile(r"^(?i:https)://github\.com/+([^/\s?#]+)/([^/\s?#;]+)(?:[/?#;].*)?$")
+
+# GitHub API 요청 헤더 (import 시 한 번만 생성)
+# Optional: GITHUB_TOKEN 있으면 rate limit 완화 / private repo 접근용
+_TOKEN = os.getenv("GITHUB_TOKEN")
+_BASE_HEADERS = {"Accept": "application/vnd.github+json"}
+if _TOKEN:
+    _BASE_HEADERS["Authorization"] = f"Bearer {_TOKEN}"
+
+# 연결 재사용(keep-alive) + 일시적인 5xx 재시도를 위한 공용 세션
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+_SESSION.headers.update(_BASE_HEADERS)
+
+# 브랜치 목록 / main·master 커밋 SHA / README를 한 번에 가져오는 GraphQL 쿼리
+# (GraphQL 트리는 재귀 조회가 안 되므로 트리 자체는 REST recursive=1로 1회 요청)
+REPOSITORY_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    main: ref(qualifiedName: "refs/heads/main") { target { oid } }
+    master: ref(qualifiedName: "refs/heads/master") { target { oid } }
+    refs(refPrefix: "refs/heads/", first: 100) { nodes { name } }
+    readme_md: object(expression: "HEAD:README.md") { ... on Blob { text } }
+    readme_lower: object(expression: "HEAD:readme.md") { ... on Blob { text } }
+    readme_rst: object(expression: "HEAD:README.rst") { ... on Blob { text } }
+    readme_txt: object(expression: "HEAD:README") { ... on Blob { text } }
+  }
+}
+"""
+
+# GraphQL 결과 캐시 {(owner, repo): (만료 시각, data)} (한 번의 rerun 안에서 재사용)
+REPOSITORY_QUERY_TTL = 60
+_repository_query_cache: dict = {}
+
+# 소스 코드 아카이브(ZIP) 다운로드 설정
+GITHUB_CODELOAD_BASE = "https://codeload.github.com"
+SOURCE_EXTENSIONS = (
+    ".py", ".js", ".jsx", ".ts", ".tsx", ".java", ".kt", ".go", ".rs", ".c", ".h",
+    ".cpp", ".hpp", ".cs", ".rb", ".php", ".swift", ".scala", ".sh",
+)
+SOURCE_MAX_CHARS = 4000             # 파일당 포함할 최대 글자 수
+SOURCE_MAX_FILE_SIZE = 1024 * 1024  # 이보다 큰 파일(생성 코드 등)은 건너뜀
+SOURCE_MAX_FILES = 500              # 모을 최대 파일 수
+SOURCE_MAX_ARCHIVE_SIZE = 50 * 1024 * 1024  # 이보다 큰 아카이브는 받지 않음
+
+# 트리 캐시
+# - 메모리: {(owner, repo): (만료 시각, tree list)} → TTL 동안은 SHA 확인 요청도 생략
+# - 디스크: (owner, repo, commit SHA)별 JSON 파일 → SHA가 같으면 트리 요청 생략
+TREE_CACHE_TTL = 900
+TREE_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".github_cache")
+_tree_memory_cache: dict = {}
+
+
+@functools.lru_cache(maxsize=128)
 def parse_github_repo_url(_url: str):
     """
     GitHub 저장소 URL을 파싱해서 (owner, repo)를 반환.
     유효하지 않으면 (None, None) 반환.
     """
-    parsed = urlparse(_url)
-    paths = parsed.path.strip("/").split("/")
-
-    if parsed.scheme != "https":
-        return None, None
-    if parsed.netloc != "github.com":
-        return None, None
-    if len(paths) < 2:
-        return None, None
-
-    owner, repo = paths[0], paths[1]
-    if not owner or not repo:
-        return None, None
-
-    return owner, repo
+    # urlparse처럼 앞뒤 공백은 무시
+    m = _REPO_URL_PATTERN.match((_url or "").strip())
+    return (m.group(1), m.group(2)) if m else (None, None)
 
 
 def url_check(_url: str) -> bool:
@@ -49,22 +107,37 @@ def github_api_get(endpoint: str, params: dict | None = None) -> requests.Respon
     GitHub API GET 공통 함수.
     - endpoint: "/repos/{owner}/{repo}/branches" 같은 경로
     - params: querystring 파라미터
-    - 필요 시 GITHUB_TOKEN 환경변수로 인증 헤더 추가
     """
     url = GITHUB_API_BASE + endpoint
 
-    headers = {
-        "Accept": "application/vnd.github+json",
-    }
+    try:
+        response = _SESSION.get(url, params=params, timeout=10)
+    except requests.RequestException:
+        return None
+
+    if response.status_code != 200:
+        return None
+
+    return response
 
-    # Optional: 토큰 있으면 rate limit 완화 / private repo 접근용
-    token = os.getenv("GITHUB_TOKEN")
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
+# ---------------------------------------------------
+# GitHub API 비동기 유틸 (여러 요청을 동시에 전송)
+# ---------------------------------------------------
+def _async_client() -> httpx.AsyncClient:
+    """
+    GitHub API용 httpx 비동기 클라이언트 생성
+    """
+    return httpx.AsyncClient(base_url=GITHUB_API_BASE, headers=_BASE_HEADERS, timeout=10)
+
+
+async def _aget(client: httpx.AsyncClient, endpoint: str, params: dict | None = None) -> httpx.Response | None:
+    """
+    github_api_get의 비동기 버전 (실패/200 이외 응답은 None)
+    """
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-    except requests.RequestException:
+        response = await client.get(endpoint, params=params)
+    except httpx.HTTPError:
         return None
 
     if response.status_code != 200:
@@ -73,6 +146,303 @@ def github_api_get(endpoint: str, params: dict | None = None) -> requests.Respon
     return response
 
 
+async def _abranch_list(client: httpx.AsyncClient, owner: str, repo: str) -> list:
+    """
+    브랜치 목록 (비동기)
+    """
+    response = await _aget(client, f"/repos/{owner}/{repo}/branches")
+    if response is None:
+        return []
+
+    return _parse_branch_list(response.json())
+
+
+async def _areadme_string(client: httpx.AsyncClient, owner: str, repo: str) -> str | None:
+    """
+    README 내용 (비동기)
+    """
+    response = await _aget(client, f"/repos/{owner}/{repo}/readme")
+    if response is None:
+        return None
+
+    return _parse_readme(response.json())
+
+
+async def _atree_list(client: httpx.AsyncClient, owner: str, repo: str, use_cache: bool = True) -> list | None:
+    """
+    전체 트리 리스트 (비동기)
+    main / master 브랜치를 동시에 조회하고 main → master 순으로 선택
+    """
+    branches_to_try = ["main", "master"]
+
+    # 브랜치 정보에서 커밋 SHA 가져오기
+    responses = await asyncio.gather(*[
+        _aget(client, f"/repos/{owner}/{repo}/branches/{branch}")
+        for branch in branches_to_try
+    ])
+
+    commit_sha = None
+    for response in responses:
+        if response is not None:
+            commit_sha = str(response.json()["commit"]["sha"])
+            break
+
+    if not commit_sha:
+        return None
+
+    # 같은 커밋의 트리가 디스크에 있으면 재사용
+    if use_cache:
+        file_list = _tree_disk_load(owner, repo, commit_sha)
+        if file_list is not None:
+            return file_list
+
+    # 트리 구조 가져오기 (recursive=1)
+    response = await _aget(client, f"/repos/{owner}/{repo}/git/trees/{commit_sha}", params={"recursive": "1"})
+    if response is None:
+        return None
+
+    file_list = response.json().get("tree", [])
+    _tree_disk_save(owner, repo, commit_sha, file_list)
+    return file_list
+
+
+async def _arepository_data(owner: str, repo: str, use_cache: bool = True) -> tuple:
+    """
+    브랜치 목록 / README / 트리 리스트를 동시에 가져오기
+    """
+    async with _async_client() as client:
+        return await asyncio.gather(
+            _abranch_list(client, owner, repo),
+            _areadme_string(client, owner, repo),
+            _atree_list(client, owner, repo, use_cache),
+        )
+
+
+async def _afetch_tree_list(owner: str, repo: str, use_cache: bool = True) -> list | None:
+    """
+    url_tree_list용 진입점 (클라이언트 생성 후 트리 조회)
+    """
+    async with _async_client() as client:
+        return await _atree_list(client, owner, repo, use_cache)
+
+
+# ---------------------------------------------------
+# GitHub GraphQL (v4) 일괄 조회
+# ---------------------------------------------------
+def github_graphql_repository(owner: str, repo: str, use_cache: bool = True) -> dict | None:
+    """
+    GraphQL 요청 1회로 브랜치 목록 / 커밋 SHA / README 조회.
+    GraphQL은 인증이 필수라서 GITHUB_TOKEN이 없거나 실패하면 None (→ REST 사용)
+    {"branches": list, "commit_sha": str | None, "readme": str | None}
+    """
+    if not _TOKEN:
+        return None
+
+    now = time.time()
+    cached = _repository_query_cache.get((owner, repo))
+    if use_cache and cached is not None and cached[0] > now:
+        return cached[1]
+
+    try:
+        response = _SESSION.post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": REPOSITORY_QUERY, "variables": {"owner": owner, "name": repo}},
+            timeout=10,
+        )
+    except requests.RequestException:
+        return None
+
+    if response.status_code != 200:
+        return None
+
+    repository = (response.json().get("data") or {}).get("repository")
+    if not repository:
+        return None
+
+    # main → master 순으로 커밋 SHA 선택
+    commit_sha = None
+    for branch in ["main", "master"]:
+        ref = repository.get(branch)
+        if ref and ref.get("target"):
+            commit_sha = str(ref["target"]["oid"])
+            break
+
+    readme = None
+    for alias in ["readme_md", "readme_lower", "readme_rst", "readme_txt"]:
+        blob = repository.get(alias)
+        if blob and blob.get("text") is not None:
+            readme = blob["text"]
+            break
+
+    data = {
+        "branches": [node["name"] for node in repository["refs"]["nodes"]],
+        "commit_sha": commit_sha,
+        "readme": readme,
+    }
+    _repository_query_cache[(owner, repo)] = (now + REPOSITORY_QUERY_TTL, data)
+    return data
+
+
+def _tree_list_by_sha(owner: str, repo: str, commit_sha: str, use_cache: bool = True) -> list | None:
+    """
+    커밋 SHA로 전체 트리 리스트 조회 (recursive=1)
+    """
+    # 같은 커밋의 트리가 디스크에 있으면 재사용
+    if use_cache:
+        file_list = _tree_disk_load(owner, repo, commit_sha)
+        if file_list is not None:
+            return file_list
+
+    endpoint = f"/repos/{owner}/{repo}/git/trees/{commit_sha}"
+    response = github_api_get(endpoint, params={"recursive": "1"})
+    if response is None:
+        return None
+
+    file_list = response.json().get("tree", [])
+    _tree_disk_save(owner, repo, commit_sha, file_list)
+    return file_list
+
+
+# ---------------------------------------------------
+# 트리 캐시 (메모리 / 디스크)
+# ---------------------------------------------------
+def _tree_memory_load(owner: str, repo: str) -> list | None:
+    """
+    TTL 안에 가져온 트리가 있으면 반환
+    """
+    cached = _tree_memory_cache.get((owner, repo))
+    if cached is not None and cached[0] > time.time():
+        return cached[1]
+    return None
+
+
+def _tree_memory_save(owner: str, repo: str, file_list: list) -> None:
+    _tree_memory_cache[(owner, repo)] = (time.time() + TREE_CACHE_TTL, file_list)
+
+
+def _tree_disk_path(owner: str, repo: str, commit_sha: str) -> str:
+    name = hashlib.sha256(f"{owner}/{repo}@{commit_sha}".encode("utf-8")).hexdigest()
+    return os.path.join(TREE_CACHE_DIR, name + ".json")
+
+
+def _tree_disk_load(owner: str, repo: str, commit_sha: str) -> list | None:
+    """
+    디스크에서 커밋 SHA별 트리 읽기 (없으면 None)
+    """
+    try:
+        with open(_tree_disk_path(owner, repo, commit_sha), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _tree_disk_save(owner: str, repo: str, commit_sha: str, file_list: list) -> None:
+    """
+    커밋 SHA별 트리를 디스크에 저장 (실패해도 무시)
+    """
+    path = _tree_disk_path(owner, repo, commit_sha)
+    try:
+        os.makedirs(TREE_CACHE_DIR, exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(file_list, f, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+
+
+# ---------------------------------------------------
+# 응답 파싱 / 변환 유틸
+# ---------------------------------------------------
+def _parse_branch_list(branches: list) -> list:
+    """
+    /branches 응답을 브랜치 이름 리스트로 변환
+    """
+    return [branch["name"] for branch in branches]
+
+
+def _parse_readme(data: dict) -> str | None:
+    """
+    /readme 응답(base64)을 문자열로 변환
+    """
+    if "content" not in data:
+        return None
+
+    readme_bytes = base64.b64decode(data["content"])
+    return readme_bytes.decode("utf-8", errors="ignore")
+
+
+def _rest_readme_string(owner: str, repo: str) -> str | None:
+    """
+    REST /readme로 README 조회 (파일명과 관계없이 GitHub가 찾은 README)
+    """
+    response = github_api_get(f"/repos/{owner}/{repo}/readme")
+    if response is None:
+        return None
+
+    return _parse_readme(response.json())
+
+
+def _tree_list_to_dict(file_list: list) -> dict:
+    """
+    트리 리스트를 계층적인 dict 구조로 변환
+    GitHub는 상위 폴더 → 하위 항목 순서(pre-order)로 반환하므로
+    현재 경로의 폴더 스택을 유지하고, 경로가 달라지는 지점까지만 되돌아감
+    (매 항목마다 split / 루트부터 setdefault 반복 방지)
+    """
+    tree_dict: dict = {}
+    # (폴더 경로 + "/", 해당 폴더 dict)
+    stack = [("", tree_dict)]
+
+    for item in file_list:
+        path = item["path"]
+
+        # 현재 항목의 상위 폴더가 나올 때까지 스택 되돌리기
+        while len(stack) > 1 and not path.startswith(stack[-1][0]):
+            stack.pop()
+        prefix, node = stack[-1]
+
+        # 상위 폴더 항목이 앞에 없었던 경우에만 중간 폴더를 따라 내려감
+        start = len(prefix)
+        slash = path.find("/", start)
+        while slash != -1:
+            name = path[start:slash]
+            child = node.get(name)
+            if not isinstance(child, dict):
+                child = node[name] = {}
+            node = child
+            stack.append((path[:slash + 1], node))
+            start = slash + 1
+            slash = path.find("/", start)
+
+        name = path[start:]
+        if item["type"] == "tree":
+            child = node.setdefault(name, {})
+            if isinstance(child, dict):
+                stack.append((path + "/", child))
+        else:
+            node[name] = None
+
+    return tree_dict
+
+
+def _tree_string_lines(node: dict, prefix: str, lines: list) -> None:
+    """
+    트리 dict를 한 번 순회하며 출력 줄을 lines에 추가 (폴더 → 파일, 이름순)
+    - prefix: 상위 폴더들에서 이어지는 들여쓰기 문자열
+    """
+    folders = sorted(k for k, v in node.items() if isinstance(v, dict))
+    files = sorted(k for k, v in node.items() if v is None)
+    last_index = len(folders) + len(files) - 1
+
+    for i, name in enumerate(folders):
+        is_last = (i == last_index)
+        lines.append(prefix + ("└── " if is_last else "├── ") + name + "/")
+        _tree_string_lines(node[name], prefix + ("    " if is_last else "│   "), lines)
+
+    for i, name in enumerate(files, len(folders)):
+        lines.append(prefix + ("└── " if i == last_index else "├── ") + name)
+
+
 # ---------------------------------------------------
 # Public Function
 # ---------------------------------------------------
@@ -84,14 +454,18 @@ def url_branch_list(_url: str) -> list:
         return []
 
     owner, repo = parse_github_repo_url(_url)
+
+    data = github_graphql_repository(owner, repo)
+    if data is not None:
+        return data["branches"]
+
     endpoint = f"/repos/{owner}/{repo}/branches"
 
     response = github_api_get(endpoint)
     if response is None:
         return []
 
-    branches = response.json()
-    return [branch["name"] for branch in branches]
+    return _parse_branch_list(response.json())
 
 
 def url_readme_string(_url: str) -> str | None:
@@ -102,112 +476,177 @@ def url_readme_string(_url: str) -> str | None:
         return None
 
     owner, repo = parse_github_repo_url(_url)
-    endpoint = f"/repos/{owner}/{repo}/readme"
-
-    response = github_api_get(endpoint)
-    if response is None:
-        return None
 
-    data = response.json()
-    if "content" not in data:
-        return None
+    # GraphQL은 대표 파일명만 조회하므로 못 찾으면 REST /readme로 재시도
+    data = github_graphql_repository(owner, repo)
+    if data is not None and data["readme"] is not None:
+        return data["readme"]
 
-    readme_bytes = base64.b64decode(data["content"])
-    return readme_bytes.decode("utf-8", errors="ignore")
+    return _rest_readme_string(owner, repo)
 
 
-def url_tree_list(_url: str) -> list | None:
+def url_tree_list(_url: str, _use_cache: bool = True) -> list | None:
     """
     GitHub 저장소의 전체 트리(raw tree list)를 반환
-    (main → master 순으로 브랜치 탐색)
+    (main / master 브랜치를 동시에 조회, main → master 순으로 선택)
+    - _use_cache=False면 메모리/디스크 캐시를 무시하고 다시 가져옴
     """
     if not url_check(_url):
         return None
 
     owner, repo = parse_github_repo_url(_url)
 
-    branches_to_try = ["main", "master"]
-    commit_sha = None
-
-    # 브랜치 정보에서 커밋 SHA 가져오기
-    for branch in branches_to_try:
-        endpoint = f"/repos/{owner}/{repo}/branches/{branch}"
-        response = github_api_get(endpoint)
-        if response is not None:
-            commit_sha = str(response.json()["commit"]["sha"])
-            break
-
-    if not commit_sha:
-        return None
+    if _use_cache:
+        file_list = _tree_memory_load(owner, repo)
+        if file_list is not None:
+            return file_list
 
-    # 트리 구조 가져오기 (recursive=1)
-    endpoint = f"/repos/{owner}/{repo}/git/trees/{commit_sha}"
-    response = github_api_get(endpoint, params={"recursive": "1"})
-    if response is None:
-        return None
+    data = github_graphql_repository(owner, repo, _use_cache)
+    if data is not None and data["commit_sha"]:
+        file_list = _tree_list_by_sha(owner, repo, data["commit_sha"], _use_cache)
+    else:
+        file_list = asyncio.run(_afetch_tree_list(owner, repo, _use_cache))
 
-    return response.json().get("tree", [])
+    if file_list is not None:
+        _tree_memory_save(owner, repo, file_list)
+    return file_list
 
 
-def url_tree_dict(_url: str) -> dict | None:
+def url_tree_dict(_url: str, _use_cache: bool = True) -> dict | None:
     """
     트리 리스트를 계층적인 dict 구조로 변환
     """
-    file_list = url_tree_list(_url)
+    file_list = url_tree_list(_url, _use_cache)
     if file_list is None:
         return None
 
-    tree_dict: dict = {}
+    return _tree_list_to_dict(file_list)
 
-    for item in file_list:
-        parts = item["path"].split("/")
-        node = tree_dict
-        for p in parts[:-1]:
-            node = node.setdefault(p, {})
-        if item["type"] == "tree":
-            node.setdefault(parts[-1], {})
-        else:
-            node[parts[-1]] = None
 
-    return tree_dict
+def url_repository_data(_url: str, _use_cache: bool = True) -> dict | None:
+    """
+    브랜치 목록 / README / 트리 dict를 한 번에 반환
+    (토큰이 있으면 GraphQL 1회 + 트리 1회, 없으면 REST 요청들을 동시에 전송)
+    {"branches": list, "readme": str | None, "tree_dict": dict | None}
+    """
+    if not url_check(_url):
+        return None
+
+    owner, repo = parse_github_repo_url(_url)
+
+    data = github_graphql_repository(owner, repo, _use_cache)
+    if data is not None and data["commit_sha"]:
+        branches, readme = data["branches"], data["readme"]
+        # GraphQL은 대표 파일명만 조회하므로 못 찾은 README만 REST /readme로 보충
+        if readme is None:
+            readme = _rest_readme_string(owner, repo)
+        file_list = _tree_list_by_sha(owner, repo, data["commit_sha"], _use_cache)
+    else:
+        branches, readme, file_list = asyncio.run(_arepository_data(owner, repo, _use_cache))
+
+    if file_list is not None:
+        _tree_memory_save(owner, repo, file_list)
+
+    return {
+        "branches": branches,
+        "readme": readme,
+        "tree_dict": None if file_list is None else _tree_list_to_dict(file_list),
+    }
 
 
-def url_tree_string(_url: str) -> str | None:
+def url_tree_string(_url: str, _use_cache: bool = True) -> str | None:
     """
     dict 기반 트리를 사람이 읽기 쉬운 문자열 트리로 변환
     """
-    tree_dict = url_tree_dict(_url)
+    tree_dict = url_tree_dict(_url, _use_cache)
     if tree_dict is None:
         return None
 
-    tree_string = ""
-    stack = [(tree_dict, None, [])]
+    # 줄 단위로 리스트에 모은 뒤 한 번에 join (문자열 += 반복 방지)
+    lines = ["Root"]
+    _tree_string_lines(tree_dict, "", lines)
+    return "\n".join(lines) + "\n"
 
-    while stack:
-        node, name, depth_info = stack.pop()
 
-        if name is not None:
-            indent = ""
-            for is_last in depth_info[:-1]:
-                indent += "    " if is_last else "│   "
-            is_last = depth_info[-1]
-            branch = "└── " if is_last else "├── "
-            if isinstance(node, dict):
-                tree_string += indent + branch + name + "/\n"
-            else:
-                tree_string += indent + branch + name + "\n"
+def _read_limited(response: requests.Response, max_bytes: int) -> bytes | None:
+    """
+    스트리밍 응답을 max_bytes까지만 읽기 (넘으면 None)
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        return None
+
+    buffer = io.BytesIO()
+    try:
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buffer.write(chunk)
+            if buffer.tell() > max_bytes:
+                return None
+    except requests.RequestException:
+        return None
+    return buffer.getvalue()
 
-        if isinstance(node, dict):
-            folders = sorted([k for k, v in node.items() if isinstance(v, dict)])
-            files = sorted([k for k, v in node.items() if v is None])
-            keys = folders + files
 
-            for i in range(len(keys) - 1, -1, -1):
-                key = keys[i]
-                is_last_child = (i == len(keys) - 1)
-                stack.append((node[key], key, depth_info + [is_last_child]))
+def download_source_zip(_url: str, _extensions: tuple = SOURCE_EXTENSIONS) -> dict | None:
+    """
+    저장소 ZIP 아카이브를 한 번에 받아 소스 파일 내용을 dict로 반환
+    (파일마다 /contents 요청을 보내는 대신 HTTP 요청 1회)
+    - main → master 순으로 브랜치 탐색
+    - _extensions에 해당하는 파일만, 파일당 SOURCE_MAX_CHARS 글자까지, 최대 SOURCE_MAX_FILES개
+    - 아카이브가 SOURCE_MAX_ARCHIVE_SIZE보다 크면 None
+    {"path/to/file.py": "code...", ...}
+    """
+    if not url_check(_url):
+        return None
+
+    owner, repo = parse_github_repo_url(_url)
+
+    archive = None
+    for branch in ["main", "master"]:
+        zip_url = f"{GITHUB_CODELOAD_BASE}/{owner}/{repo}/zip/refs/heads/{branch}"
+        try:
+            # codeload는 API가 아니므로 세션의 인증 헤더는 보내지 않음
+            response = _SESSION.get(zip_url, headers={"Authorization": None}, timeout=30, stream=True)
+        except requests.RequestException:
+            return None
+        with response:
+            if response.status_code != 200:
+                continue
+            archive = _read_limited(response, SOURCE_MAX_ARCHIVE_SIZE)
+            break
+
+    if archive is None:
+        return None
+
+    try:
+        zf = zipfile.ZipFile(io.BytesIO(archive))
+    except zipfile.BadZipFile:
+        return None
 
-    return "Root\n" + tree_string
+    source_code = {}
+    with zf:
+        for info in zf.infolist():
+            if info.is_dir() or info.file_size > SOURCE_MAX_FILE_SIZE:
+                continue
+
+            # 최상위 "{repo}-{branch}/" 폴더 제거 후 경로 정규화
+            # (절대 경로 / 상위 폴더로 벗어나는 경로는 무시 - zip slip 방지)
+            _, _, path = info.filename.partition("/")
+            path = posixpath.normpath(path)
+            if path in (".", "..") or path.startswith(("/", "../")):
+                continue
+
+            if not path.lower().endswith(_extensions):
+                continue
+
+            # 헤더의 file_size를 믿지 않고 필요한 만큼만 압축 해제
+            with zf.open(info) as f:
+                data = f.read(SOURCE_MAX_CHARS * 4)
+            source_code[path] = data.decode("utf-8", "ignore")[:SOURCE_MAX_CHARS]
+            if len(source_code) >= SOURCE_MAX_FILES:
+                break
+
+    return source_code
 
 
 # ---------------------------------------------------
@@ -3,38 +3,35 @@
 # ---------------------------------------------------
 # Import module
 # ---------------------------------------------------
+import hashlib
+import openai
 from openai import OpenAI
 
+# API 키 검사 결과 메모 {키의 SHA-256: bool}
+_api_check_results = {}
+
 # ---------------------------------------------------
 # Function
 # ---------------------------------------------------
 def api_check(_key:str) -> bool:
+    # 같은 키는 이전 검사 결과 재사용
+    key_hash = hashlib.sha256(str(_key).encode("utf-8")).hexdigest()
+    if key_hash in _api_check_results:
+        return _api_check_results[key_hash]
     try:
         client = OpenAI(api_key=_key)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system", 
-                    # 반드시 영어로 대답 해야합니다.
-                    "content": (
-                        "You must answer in English."
-                    )
-                },
-                {
-                    "role": "user", 
-                    # 핑
-                    "content": (
-                        "ping"
-                    )
-                }
-            ]
-        )
-        # print(response.choices[0].message.content)
-        return True
+        # 모델 정보 조회로 인증만 확인 (토큰 소모 없음)
+        client.models.retrieve("gpt-4o-mini")
+        result = True
+    except (openai.AuthenticationError, openai.PermissionDeniedError) as e:
+        # print(e)
+        result = False
     except Exception as e:
+        # 네트워크 오류 등 일시적인 실패는 기억하지 않음
         # print(e)
         return False
+    _api_check_results[key_hash] = result
+    return result
 
 def api_repository_structure(_key:str, _file_tree:dict, _language:str="English") -> str:
     parsed_file_tree = str(_file_tree)
@@ -68,7 +65,7 @@ def api_repository_structure(_key:str, _file_tree:dict, _language:str="English")
         )
         return str(response.choices[0].message.content)
     except Exception as e:
-        return str(e)
+        return f"Error: {str(e)}"
 
 def api_environment_setup(_key:str, _file_tree:dict, _readme:str, _language:str="English") -> str:
     parsed_file_tree = str(_file_tree)
@@ -105,7 +102,7 @@ def api_environment_setup(_key:str, _file_tree:dict, _readme:str, _language:str=
         )
         return str(response.choices[0].message.content)
     except Exception as e:
-        return str(e)
+        return f"Error: {str(e)}"
 
 # ---------------------------------------------------
 # Test
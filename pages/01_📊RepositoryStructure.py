@@ -5,8 +5,8 @@
 # ---------------------------------------------------
 import streamlit as st
 import module.github as github
-import module.gpt as gpt
-import module.gemini as gemini
+import module.cache as cache
+# gemini는 스트리밍이 필요할 때만 import (google.genai 로딩 지연)
 
 # ---------------------------------------------------
 # Load state into variables
@@ -40,9 +40,30 @@ st.header("🗃️ File Tree")
 
 file_tree = contents["01"]["File Tree"]
 
+# 새로고침 시 캐시를 무시하고 다시 가져오기
+use_cache = not st.button("🔄 새로고침")
+if not use_cache:
+    # 이전 트리와 그 트리에 대한 AI 분석을 함께 초기화
+    file_tree = ""
+    contents["01"]["File Tree"] = ""
+    contents["01"]["AI Comment"] = ""
+    st.session_state["contents"] = contents
+
 with st.spinner("Wait for it...", show_time=True):
     if not file_tree:
-        file_tree = github.url_tree_string(repository_url)
+        if use_cache:
+            try:
+                file_tree = cache.url_tree_string(repository_url)
+            except cache.FetchError as e:
+                # 실패 결과는 저장하지 않고 다음에 다시 시도
+                st.error(str(e))
+                st.stop()
+        else:
+            cache.clear_github()
+            file_tree = github.url_tree_string(repository_url, use_cache)
+            if file_tree is None:
+                st.error(cache.GITHUB_ERROR_MESSAGE)
+                st.stop()
         contents["01"]["File Tree"] = file_tree
         st.session_state["contents"] = contents
 
@@ -60,13 +81,32 @@ api_type = options["api_type"]
 repository_url = options["repository_url"]
 ai_comment = contents["01"]["AI Comment"]
 
-with st.spinner("Wait for it...", show_time=True):
-    if not ai_comment:
-        if api_type == "GPT":
-            ai_comment = gpt.api_repository_structure(api_key, github.url_tree_dict(repository_url), language)
-        elif api_type == "GEMINI":
-            ai_comment = gemini.api_repository_structure(api_key, github.url_tree_dict(repository_url), language)
+if not ai_comment and api_type == "GEMINI":
+    # Gemini는 응답을 받는 대로 바로 표시 (스트리밍)
+    import module.gemini as gemini
+    try:
+        tree_dict = cache.url_tree_dict(repository_url)
+    except cache.FetchError as e:
+        st.error(str(e))
+        st.stop()
+    try:
+        ai_comment = st.write_stream(gemini.api_repository_structure_stream(api_key, tree_dict, language))
+    except gemini.StreamError as e:
+        # 실패(도중 실패 포함)한 응답은 저장하지 않고 다음에 다시 시도
+        st.error(str(e))
+        st.stop()
 
-        contents["01"]["AI Comment"] = ai_comment
-        st.session_state["contents"] = contents
-    st.write(ai_comment)
+    contents["01"]["AI Comment"] = ai_comment
+    st.session_state["contents"] = contents
+else:
+    with st.spinner("Wait for it...", show_time=True):
+        if not ai_comment:
+            try:
+                ai_comment = cache.api_repository_structure(api_type, api_key, repository_url, language)
+            except cache.FetchError as e:
+                st.error(str(e))
+                st.stop()
+
+            contents["01"]["AI Comment"] = ai_comment
+            st.session_state["contents"] = contents
+        st.write(ai_comment)
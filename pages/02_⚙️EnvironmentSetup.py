@@ -4,9 +4,7 @@
 # Import module
 # ---------------------------------------------------
 import streamlit as st
-import module.github as github
-import module.gpt as gpt
-import module.gemini as gemini
+import module.cache as cache
 
 # ---------------------------------------------------
 # Load state into variables
@@ -46,10 +44,12 @@ ai_comment = contents["02"]["AI Comment"]
 
 with st.spinner("Wait for it...", show_time=True):
     if not ai_comment:
-        if api_type == "GPT":
-            ai_comment = gpt.api_environment_setup(api_key, github.url_tree_dict(repository_url), github.url_readme_string(repository_url), language)
-        elif api_type == "GEMINI":
-            ai_comment = gemini.api_environment_setup(api_key, github.url_tree_dict(repository_url), github.url_readme_string(repository_url), language)
+        try:
+            ai_comment = cache.api_environment_setup(api_type, api_key, repository_url, language)
+        except cache.FetchError as e:
+            # 실패 결과는 저장하지 않고 다음에 다시 시도
+            st.error(str(e))
+            st.stop()
 
         contents["02"]["AI Comment"] = ai_comment
         st.session_state["contents"] = contents
@@ -4,9 +4,7 @@
 # Import module
 # ---------------------------------------------------
 import streamlit as st
-import module.github as github
-import module.gpt as gpt
-import module.gemini as gemini
+import module.cache as cache
 
 # ---------------------------------------------------
 # Load state into variables
@@ -37,3 +35,22 @@ st.title("🔍 CodeFlow Analysis")
 # AI Comment
 # ---------------------------------------------------
 st.header("🤖 AI Comment")
+
+language = options["language"]
+api_key = options["api_key"]
+api_type = options["api_type"]
+repository_url = options["repository_url"]
+ai_comment = contents["03"]["AI Comment"]
+
+with st.spinner("Wait for it...", show_time=True):
+    if not ai_comment:
+        try:
+            ai_comment = cache.api_code_flow_analysis(api_type, api_key, repository_url, language)
+        except cache.FetchError as e:
+            # 실패 결과는 저장하지 않고 다음에 다시 시도
+            st.error(str(e))
+            st.stop()
+
+        contents["03"]["AI Comment"] = ai_comment
+        st.session_state["contents"] = contents
+    st.write(ai_comment)
@@ -5,8 +5,6 @@
 # ---------------------------------------------------
 import streamlit as st
 import module.github as github
-import module.gpt as gpt
-import module.gemini as gemini
 
 # ---------------------------------------------------
 # Load state into variables